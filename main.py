@@ -2,14 +2,33 @@
 
 import sys
 import argparse
-from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from flashcard_quizzer.models import FlashcardLoader  # noqa: E402
-from flashcard_quizzer.strategies import get_strategy  # noqa: E402
-from flashcard_quizzer.quiz import QuizEngine, InteractiveQuiz  # noqa: E402
+def _import_package():
+    """
+    Import the flashcard_quizzer modules, lazily.
+
+    Deferred until after argument parsing so `--help` and usage errors
+    don't pay the package import cost. Prefers an installed package
+    (`pip install -e .`); falls back to the src/ layout when running
+    straight from a source checkout.
+
+    Returns:
+        Tuple of (FlashcardLoader, get_strategy, QuizEngine, InteractiveQuiz)
+    """
+    try:
+        from flashcard_quizzer.models import FlashcardLoader
+        from flashcard_quizzer.strategies import get_strategy
+        from flashcard_quizzer.quiz import QuizEngine, InteractiveQuiz
+    except ImportError:
+        from pathlib import Path
+
+        sys.path.insert(0, str(Path(__file__).parent / "src"))
+        from flashcard_quizzer.models import FlashcardLoader
+        from flashcard_quizzer.strategies import get_strategy
+        from flashcard_quizzer.quiz import QuizEngine, InteractiveQuiz
+
+    return FlashcardLoader, get_strategy, QuizEngine, InteractiveQuiz
 
 
 def parse_arguments():
@@ -52,27 +71,35 @@ Examples:
         "--stats", action="store_true", help="Show detailed statistics at the end"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse the JSON file instead of using the parse cache",
+    )
+
     return parser.parse_args()
 
 
-def print_colored(text: str, color: str = "default"):
-    """
-    Print text with color.
+# ANSI escape codes, baked into dedicated printers at import time so the
+# per-line path is a single write with no dict lookup or color dispatch.
+_GREEN = "\033[92m"
+_RED = "\033[91m"
+_RESET = "\033[0m"
 
-    Args:
-        text: Text to print
-        color: Color name ('green', 'red', or 'default')
-    """
-    colors = {
-        "green": "\033[92m",
-        "red": "\033[91m",
-        "default": "\033[0m",
-        "reset": "\033[0m",
-    }
 
-    color_code = colors.get(color, colors["default"])
-    reset_code = colors["reset"]
-    print(f"{color_code}{text}{reset_code}")
+def print_green(text: str) -> None:
+    """Print text in green."""
+    sys.stdout.write(_GREEN + text + _RESET + "\n")
+
+
+def print_red(text: str) -> None:
+    """Print text in red."""
+    sys.stdout.write(_RED + text + _RESET + "\n")
+
+
+def print_default(text: str) -> None:
+    """Print text without color."""
+    sys.stdout.write(text + "\n")
 
 
 def main():
@@ -85,16 +112,20 @@ def main():
     try:
         args = parse_arguments()
 
+        FlashcardLoader, get_strategy, QuizEngine, InteractiveQuiz = _import_package()
+
         # Load flashcards
         print(f"\nLoading flashcards from {args.file}...")
         try:
-            flashcards = FlashcardLoader.load_from_json(args.file)
+            flashcards = FlashcardLoader.load_from_json(
+                args.file, use_cache=not args.no_cache
+            )
             print(f"Loaded {len(flashcards)} flashcards.\n")
         except FileNotFoundError as e:
-            print_colored(f"Error: {e}", "red")
+            print_red(f"Error: {e}")
             return 1
         except ValueError as e:
-            print_colored(f"Error: {e}", "red")
+            print_red(f"Error: {e}")
             return 1
 
         # Get quiz strategy
@@ -108,11 +139,11 @@ def main():
         def colored_output(text: str):
             """Output function that adds colors to feedback."""
             if "✓" in text or "Correct" in text:
-                print_colored(text, "green")
+                print_green(text)
             elif "✗" in text or "Incorrect" in text:
-                print_colored(text, "red")
+                print_red(text)
             else:
-                print(text)
+                print_default(text)
 
         # Run interactive quiz
         quiz = InteractiveQuiz(engine, output_fn=colored_output)
@@ -124,10 +155,12 @@ def main():
         original_input = input
 
         def exit_aware_input(prompt):
-            """Input function that handles 'exit' command."""
+            """Input function that returns None when the user types 'exit'."""
             user_input = original_input(prompt)
             if user_input.lower() == "exit":
-                raise KeyboardInterrupt()
+                # Sentinel understood by InteractiveQuiz.run: ends the quiz
+                # without unwinding an exception, so stats still print.
+                return None
             return user_input
 
         quiz.input_fn = exit_aware_input
@@ -142,10 +175,10 @@ def main():
         return 0
 
     except KeyboardInterrupt:
-        print_colored("\n\nExiting gracefully... Goodbye!", "default")
+        print_default("\n\nExiting gracefully... Goodbye!")
         return 0
     except Exception as e:
-        print_colored(f"\nUnexpected error: {e}", "red")
+        print_red(f"\nUnexpected error: {e}")
         return 1
 
 
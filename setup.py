@@ -9,11 +9,18 @@ setup(
     author="Flashcard Quizzer Team",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     install_requires=[
         "typing-extensions>=4.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "ijson>=3.2.0",
+            "msgspec>=0.18.0",
+            "numpy>=1.23.0",
+            "numba>=0.57.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -1,25 +1,76 @@
 """Command-line interface for flashcard quizzer."""
 
-import argparse
+import contextlib
+import io
 import sys
-from typing import Optional, List
+from types import SimpleNamespace
+from typing import Iterator, NoReturn, Optional, List
 
 from .models import FlashcardLoader
 from .strategies import get_strategy
 from .quiz import QuizEngine, InteractiveQuiz
 
+_MODES = ("sequential", "random", "adaptive")
+_USAGE = (
+    "usage: flashcard-quiz [-h] [-m {sequential,random,adaptive}] "
+    "[--no-cache] flashcard_file"
+)
 
-def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+
+@contextlib.contextmanager
+def buffered_stdout(buffer_size: int = 65536) -> Iterator[None]:
     """
-    Parse command-line arguments.
+    Swap in a block-buffered stdout for the duration of a quiz run.
+
+    When stdout is a terminal, line buffering is kept so interactive
+    feedback shows up immediately. When output is piped (e.g. to tee or a
+    log file), per-line writes each cost a syscall; a larger buffer batches
+    them. Falls back to the unwrapped stream if stdout has no usable file
+    descriptor (e.g. under test capture).
 
     Args:
-        args: Optional list of arguments (for testing)
+        buffer_size: Size of the write buffer in bytes
+    """
+    original = sys.stdout
+    try:
+        if original.isatty():
+            yield
+            return
+        fileno = original.fileno()
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        yield
+        return
+
+    buffered = io.TextIOWrapper(
+        open(fileno, "wb", buffering=buffer_size, closefd=False),
+        encoding=original.encoding or "utf-8",
+        write_through=False,
+        line_buffering=False,
+    )
+    sys.stdout = buffered
+    try:
+        yield
+    finally:
+        sys.stdout = original
+        buffered.flush()
+        buffered.close()
+
+
+def _build_parser():
+    """
+    Build the full argparse parser.
+
+    Only constructed for --help: argparse import plus parser construction
+    cost several milliseconds of cold start, which normal quiz runs skip
+    via the hand-rolled fast path in parse_args.
 
     Returns:
-        Parsed arguments namespace
+        Configured argparse.ArgumentParser
     """
+    import argparse
+
     parser = argparse.ArgumentParser(
+        prog="flashcard-quiz",
         description="Flashcard Quizzer - A terminal tool for memorizing server acronyms",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -38,12 +89,81 @@ Examples:
         "-m",
         "--mode",
         type=str,
-        choices=["sequential", "random", "adaptive"],
+        choices=list(_MODES),
         default="sequential",
         help="Quiz mode (default: sequential)",
     )
 
-    return parser.parse_args(args)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse the JSON file instead of using the parse cache",
+    )
+
+    return parser
+
+
+def _usage_error(message: str) -> NoReturn:
+    """Print a usage error the way argparse would and exit with status 2."""
+    print(_USAGE, file=sys.stderr)
+    print(f"flashcard-quiz: error: {message}", file=sys.stderr)
+    raise SystemExit(2)
+
+
+def parse_args(args: Optional[List[str]] = None) -> SimpleNamespace:
+    """
+    Parse command-line arguments.
+
+    Walks the argument list directly for the common case; -h/--help falls
+    back to the full argparse parser for formatted help output.
+
+    Args:
+        args: Optional list of arguments (for testing)
+
+    Returns:
+        Parsed arguments namespace
+    """
+    argv = list(args) if args is not None else sys.argv[1:]
+
+    if "-h" in argv or "--help" in argv:
+        return _build_parser().parse_args(argv)
+
+    namespace = SimpleNamespace(flashcard_file=None, mode="sequential", no_cache=False)
+    positionals: List[str] = []
+
+    index = 0
+    count = len(argv)
+    while index < count:
+        arg = argv[index]
+        if arg in ("-m", "--mode"):
+            index += 1
+            if index == count:
+                _usage_error("argument -m/--mode: expected one argument")
+            namespace.mode = argv[index]
+        elif arg.startswith("--mode="):
+            namespace.mode = arg.split("=", 1)[1]
+        elif arg == "--no-cache":
+            namespace.no_cache = True
+        elif arg.startswith("-") and arg != "-":
+            _usage_error(f"unrecognized arguments: {arg}")
+        else:
+            positionals.append(arg)
+        index += 1
+
+    if namespace.mode not in _MODES:
+        choices = ", ".join(repr(mode) for mode in _MODES)
+        _usage_error(
+            f"argument -m/--mode: invalid choice: {namespace.mode!r} "
+            f"(choose from {choices})"
+        )
+
+    if not positionals:
+        _usage_error("the following arguments are required: flashcard_file")
+    if len(positionals) > 1:
+        _usage_error(f"unrecognized arguments: {' '.join(positionals[1:])}")
+
+    namespace.flashcard_file = positionals[0]
+    return namespace
 
 
 def main(args: Optional[List[str]] = None) -> int:
@@ -59,21 +179,24 @@ def main(args: Optional[List[str]] = None) -> int:
     try:
         parsed_args = parse_args(args)
 
-        # Load flashcards
-        print(f"Loading flashcards from {parsed_args.flashcard_file}...")
-        flashcards = FlashcardLoader.load_from_json(parsed_args.flashcard_file)
-        print(f"Loaded {len(flashcards)} flashcards.\n")
+        with buffered_stdout():
+            # Load flashcards
+            print(f"Loading flashcards from {parsed_args.flashcard_file}...")
+            flashcards = FlashcardLoader.load_from_json(
+                parsed_args.flashcard_file, use_cache=not parsed_args.no_cache
+            )
+            print(f"Loaded {len(flashcards)} flashcards.\n")
 
-        # Get quiz strategy
-        strategy = get_strategy(parsed_args.mode)
-        print(f"Quiz mode: {parsed_args.mode}")
+            # Get quiz strategy
+            strategy = get_strategy(parsed_args.mode)
+            print(f"Quiz mode: {parsed_args.mode}")
 
-        # Create quiz engine
-        engine = QuizEngine(flashcards, strategy)
+            # Create quiz engine
+            engine = QuizEngine(flashcards, strategy)
 
-        # Run interactive quiz
-        quiz = InteractiveQuiz(engine)
-        quiz.run()
+            # Run interactive quiz
+            quiz = InteractiveQuiz(engine)
+            quiz.run()
 
         return 0
 
@@ -1,26 +1,121 @@
 """Data models for flashcard quizzer."""
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Any, Optional
+from pathlib import Path
+from typing import IO, List, Any, Optional, Iterator, Tuple, Union
+import hashlib
 import json
-
-
-@dataclass
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+import unicodedata
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _HAS_ORJSON = False
+
+try:
+    import ijson
+
+    _HAS_IJSON = True
+except ImportError:  # pragma: no cover - exercised when ijson is absent
+    _HAS_IJSON = False
+
+# Separator line used in formatted statistics output.
+_SEP = "=" * 50
+
+# Fixed block of the stats report, built once at import; %-formatting a
+# constant template runs entirely in C, unlike per-call f-string assembly.
+_STATS_TEMPLATE = (
+    "\n"
+    + _SEP
+    + "\nSession Statistics\n"
+    + _SEP
+    + "\nTotal Questions: %d"
+    + "\nCorrect Answers: %d"
+    + "\nIncorrect Answers: %d"
+    + "\nAccuracy: %.1f%%"
+)
+
+
+def normalize_answer(text: str) -> str:
+    """
+    Normalize text for answer comparison.
+
+    NFKC folds compatibility forms (full-width characters, ligatures) and
+    casefold() handles case pairs that lower() misses (German ß, Turkish İ),
+    so Unicode answers compare correctly.
+
+    Args:
+        text: The text to normalize
+
+    Returns:
+        The normalized text
+    """
+    return unicodedata.normalize("NFKC", text).strip().casefold()
+
+
+@dataclass(frozen=True, slots=True)
 class Flashcard:
-    """Represents a single flashcard with a term and definition."""
+    """
+    Represents a single flashcard with a term and definition.
+
+    Frozen and slotted: instances carry no per-object __dict__, which cuts
+    memory roughly 3x for large decks and speeds attribute access.
+    """
 
     term: str
     definition: str
+    # Normalized form of the definition, computed once at construction so
+    # answer checking never re-does the strip/lower work per submission.
+    _norm_definition: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate flashcard data."""
+        """Validate flashcard data and precompute the normalized definition."""
         if not self.term or not isinstance(self.term, str):
             raise ValueError("Flashcard term must be a non-empty string")
         if not self.definition or not isinstance(self.definition, str):
             raise ValueError("Flashcard definition must be a non-empty string")
+        # sys.intern lets repeated comparisons against the same answer hit
+        # CPython's pointer-equality fast path. object.__setattr__ is needed
+        # because the dataclass is frozen.
+        object.__setattr__(
+            self, "_norm_definition", sys.intern(normalize_answer(self.definition))
+        )
 
+    @classmethod
+    def _from_trusted(cls, term: str, definition: str) -> "Flashcard":
+        """
+        Build a flashcard from already-validated strings, skipping __init__.
+
+        The loader validates whole decks in one sweep; re-running the
+        per-field checks in __post_init__ for every materialized card
+        would repeat that work. Only call this with strings that passed
+        deck validation.
+
+        Args:
+            term: Validated non-empty term
+            definition: Validated non-empty definition
 
-@dataclass
+        Returns:
+            A fully initialized Flashcard
+        """
+        card = cls.__new__(cls)
+        object.__setattr__(card, "term", term)
+        object.__setattr__(card, "definition", definition)
+        object.__setattr__(
+            card, "_norm_definition", sys.intern(normalize_answer(definition))
+        )
+        return card
+
+
+@dataclass(frozen=True, slots=True)
 class QuizResult:
     """Represents the result of a single quiz question."""
 
@@ -29,7 +124,7 @@ class QuizResult:
     is_correct: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """Tracks statistics for a quiz session."""
 
@@ -37,6 +132,15 @@ class SessionStats:
     correct_answers: int = 0
     incorrect_answers: int = 0
     missed_terms: List[str] = field(default_factory=list)
+    # Companion set for O(1) duplicate checks; missed_terms stays a list so
+    # callers keep insertion order and indexing.
+    _missed_set: set = field(default_factory=set, repr=False, compare=False)
+    # Memoized __str__ output plus the counter pair it was rendered from;
+    # record_answer invalidates it, the key catches direct field edits.
+    _str_cache: Optional[str] = field(default=None, repr=False, compare=False)
+    _str_key: Optional[Tuple[int, int]] = field(
+        default=None, repr=False, compare=False
+    )
 
     @property
     def accuracy(self) -> float:
@@ -54,66 +158,395 @@ class SessionStats:
             term: The term that was being quizzed (for tracking missed terms)
         """
         self.total_questions += 1
+        self._str_cache = None
         if is_correct:
             self.correct_answers += 1
         else:
             self.incorrect_answers += 1
-            if term and term not in self.missed_terms:
+            if term and term not in self._missed_set:
+                self._missed_set.add(term)
                 self.missed_terms.append(term)
 
     def __str__(self) -> str:
         """Return formatted statistics."""
-        result = (
-            f"\n{'='*50}\n"
-            f"Session Statistics\n"
-            f"{'='*50}\n"
-            f"Total Questions: {self.total_questions}\n"
-            f"Correct Answers: {self.correct_answers}\n"
-            f"Incorrect Answers: {self.incorrect_answers}\n"
-            f"Accuracy: {self.accuracy:.1f}%\n"
-        )
+        key = (self.total_questions, self.correct_answers)
+        if self._str_cache is not None and self._str_key == key:
+            return self._str_cache
+
+        # Collect lines and join once: repeated += on a str is O(n^2) when
+        # the missed-terms list grows.
+        parts = [
+            _STATS_TEMPLATE
+            % (
+                self.total_questions,
+                self.correct_answers,
+                self.incorrect_answers,
+                self.accuracy,
+            )
+        ]
 
         if self.missed_terms:
-            result += "\nTerms You Missed:\n"
-            for term in self.missed_terms:
-                result += f"  - {term}\n"
+            parts.append("")
+            parts.append("Terms You Missed:")
+            parts.extend(f"  - {term}" for term in self.missed_terms)
+
+        parts.append(_SEP)
+        parts.append("")
+        rendered = "\n".join(parts)
+        self._str_cache = rendered
+        self._str_key = key
+        return rendered
+
+
+class LazyFlashcardDeck:
+    """
+    Sequence view over raw flashcard data that materializes Flashcard
+    objects on demand.
+
+    The raw parsed JSON list is kept as-is; a Flashcard is only
+    constructed (and cached) the first time an index is accessed. This
+    avoids paying object-construction cost up front for cards a quiz
+    session may never reach (e.g. adaptive mode ending early).
+    """
+
+    def __init__(self, raw_items: List[dict], key_pair: Tuple[str, str]) -> None:
+        """
+        Initialize the lazy deck.
 
-        result += "=" * 50 + "\n"
-        return result
+        Args:
+            raw_items: Pre-validated list of flashcard dicts
+            key_pair: The (term_key, definition_key) names used in raw_items
+        """
+        self._raw_items = raw_items
+        self._key_pair = key_pair
+        self._cache: List[Optional[Flashcard]] = [None] * len(raw_items)
+
+    def __len__(self) -> int:
+        """Return the number of flashcards in the deck."""
+        return len(self._raw_items)
+
+    def __getitem__(self, index: int) -> Flashcard:
+        """Return the flashcard at the given index, constructing it on demand."""
+        card = self._cache[index]
+        if card is None:
+            item = self._raw_items[index]
+            term_key, definition_key = self._key_pair
+            # The deck's raw items were validated up front, so the trusted
+            # constructor skips the per-card __post_init__ checks.
+            card = Flashcard._from_trusted(item[term_key], item[definition_key])
+            self._cache[index] = card
+        return card
+
+    def __iter__(self) -> Iterator[Flashcard]:
+        """Iterate over flashcards, materializing each on first access."""
+        for index in range(len(self._raw_items)):
+            yield self[index]
 
 
 class FlashcardLoader:
     """Loads and validates flashcards from JSON files."""
 
+    # In-process LRU of parsed decks keyed by (abspath, mtime_ns, size).
+    # A second load of an unchanged file within the same process skips
+    # even the pickle cache; sharing the deck is safe because Flashcard
+    # instances are frozen. Ordered so eviction drops the stalest entry.
+    _memory_cache: "OrderedDict[Tuple[str, int, int], LazyFlashcardDeck]" = OrderedDict()
+    _MEMORY_CACHE_SIZE = 32
+
+    @staticmethod
+    def _memory_key(filepath: str) -> Optional[Tuple[str, int, int]]:
+        """Return the in-memory cache key for a path, or None if unstattable."""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        return (str(Path(filepath).resolve()), st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _cache_dir() -> Path:
+        """
+        Return the per-user cache directory, creating it if needed.
+
+        Honors XDG_CACHE_HOME and falls back to ~/.cache. The directory
+        is private (0700): a world-shared location like /tmp would let
+        another local user pre-plant a cache file and have pickle.load
+        execute their payload on the next deck load.
+        """
+        base = os.environ.get("XDG_CACHE_HOME")
+        base_path = Path(base) if base else Path.home() / ".cache"
+        cache_dir = base_path / "flashcard_quizzer"
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        return cache_dir
+
     @staticmethod
-    def load_from_json(filepath: str) -> List[Flashcard]:
+    def _cache_path(filepath: str) -> Path:
         """
-        Load flashcards from a JSON file.
+        Compute the on-disk cache path for a flashcard file.
+
+        The filename is keyed by a digest of the absolute path alone;
+        the file's mtime is stored inside the pickle and checked on
+        load, so editing a deck overwrites its own cache entry instead
+        of orphaning the old one.
 
         Args:
-            filepath: Path to the JSON file containing flashcards
+            filepath: Path to the flashcard JSON file
 
         Returns:
-            List of Flashcard objects
+            Path of the pickle cache file in the per-user cache directory
+        """
+        abspath = str(Path(filepath).resolve())
+        digest = hashlib.sha1(abspath.encode("utf-8")).hexdigest()[:16]
+        return FlashcardLoader._cache_dir() / f"fcq_{digest}.pkl"
+
+    @staticmethod
+    def _load_cached(filepath: str) -> Optional[LazyFlashcardDeck]:
+        """Return a deck from the pickle cache, or None on any miss/failure."""
+        try:
+            mtime_ns = os.stat(filepath).st_mtime_ns
+            cache_path = FlashcardLoader._cache_path(filepath)
+            with open(cache_path, "rb") as f:
+                cached_mtime_ns, raw_items, key_pair = pickle.load(f)
+            if cached_mtime_ns != mtime_ns:
+                return None
+            return LazyFlashcardDeck(raw_items, key_pair)
+        except (OSError, pickle.PickleError, ValueError, EOFError):
+            return None
+
+    @staticmethod
+    def _store_cached(filepath: str, deck: LazyFlashcardDeck) -> None:
+        """Write the deck's validated raw data to the pickle cache, atomically."""
+        try:
+            mtime_ns = os.stat(filepath).st_mtime_ns
+            cache_path = FlashcardLoader._cache_path(filepath)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((mtime_ns, deck._raw_items, deck._key_pair), f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Caching is best-effort; a read-only temp dir just means the
+            # next run re-parses the JSON.
+            pass
+
+    @staticmethod
+    def load_from_json(
+        filepath: Union[str, os.PathLike, IO[str]], use_cache: bool = True
+    ) -> LazyFlashcardDeck:
+        """
+        Load flashcards from a JSON file or open file-like object.
+
+        Repeated loads of an unchanged file skip JSON parsing and
+        validation entirely via an mtime-validated pickle cache in the
+        per-user cache directory. File-like objects (e.g. io.StringIO)
+        are parsed directly and never touch the cache.
+
+        Args:
+            filepath: Path to the JSON file containing flashcards, or an
+                open file-like object to read the JSON from
+            use_cache: Whether to read/write the parse cache
+
+        Returns:
+            LazyFlashcardDeck of Flashcard objects
 
         Raises:
             FileNotFoundError: If the file doesn't exist
             ValueError: If JSON is invalid or doesn't match expected format
         """
+        if not isinstance(filepath, (str, os.PathLike)):
+            raw = filepath.read()
+            try:
+                FlashcardLoader._check_root(raw)
+                data = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON format: {e}")
+            return FlashcardLoader._validate_and_parse(data)
+
+        mem_key = None
+        if use_cache:
+            mem_key = FlashcardLoader._memory_key(filepath)
+            if mem_key is not None:
+                cache = FlashcardLoader._memory_cache
+                deck = cache.get(mem_key)
+                if deck is not None:
+                    cache.move_to_end(mem_key)
+                    return deck
+            cached = FlashcardLoader._load_cached(filepath)
+            if cached is not None:
+                if mem_key is not None:
+                    FlashcardLoader._memory_store(mem_key, cached)
+                return cached
+
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                data = FlashcardLoader._parse_open_file(f)
         except FileNotFoundError:
             raise FileNotFoundError(f"Flashcard file not found: {filepath}")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Both json.JSONDecodeError and orjson.JSONDecodeError are
+            # ValueError subclasses, so one handler covers either parser.
             raise ValueError(f"Invalid JSON format: {e}")
 
-        return FlashcardLoader._validate_and_parse(data)
+        deck = FlashcardLoader._validate_and_parse(data)
+        if use_cache:
+            FlashcardLoader._store_cached(filepath, deck)
+            if mem_key is not None:
+                FlashcardLoader._memory_store(mem_key, deck)
+        return deck
 
     @staticmethod
-    def _validate_and_parse(data: Any) -> List[Flashcard]:
+    def load_from_json_stream(
+        filepath: Union[str, os.PathLike]
+    ) -> Iterator[Flashcard]:
+        """
+        Yield flashcards from a JSON file one at a time.
+
+        With ijson installed, only the term/definition strings of the
+        current card are materialized, so multi-megabyte decks never hold
+        the full parsed document in memory. Without ijson this falls back
+        to the eager loader and yields from the resulting deck, producing
+        identical cards either way.
+
+        Args:
+            filepath: Path to the JSON file containing flashcards
+
+        Yields:
+            Flashcard objects in file order
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If JSON is invalid or doesn't match expected format
         """
-        Validate and parse JSON data into Flashcard objects.
+        if not _HAS_IJSON:
+            yield from FlashcardLoader.load_from_json(filepath, use_cache=False)
+            return
+
+        try:
+            with open(filepath, "rb") as f:
+                # Sniff the document head once to pick the ijson prefix:
+                # a top-level array streams "item", an object streams
+                # under whichever wrapper key it declares.
+                head = f.read(4096)
+                f.seek(0)
+                stripped = head.lstrip()
+                if stripped.startswith(b"["):
+                    prefix = "item"
+                elif b'"cards"' in head:
+                    prefix = "cards.item"
+                else:
+                    prefix = "flashcards.item"
+
+                key_pair: Optional[Tuple[str, str]] = None
+                count = 0
+                for idx, item in enumerate(ijson.items(f, prefix)):
+                    if key_pair is None:
+                        if isinstance(item, dict) and "front" in item and "back" in item:
+                            key_pair = ("front", "back")
+                        else:
+                            key_pair = ("term", "definition")
+                    try:
+                        term = item[key_pair[0]]
+                        definition = item[key_pair[1]]
+                    except TypeError:
+                        raise ValueError(f"Flashcard at index {idx} must be an object")
+                    except KeyError:
+                        raise ValueError(
+                            f"Flashcard at index {idx} must have either "
+                            "'front'/'back' or 'term'/'definition' keys"
+                        )
+                    try:
+                        yield Flashcard(term=term, definition=definition)
+                    except ValueError as e:
+                        raise ValueError(f"Invalid flashcard at index {idx}: {e}")
+                    count += 1
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Flashcard file not found: {filepath}")
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON format: {e}")
+
+        if count == 0:
+            raise ValueError("Flashcards list cannot be empty")
+
+    @staticmethod
+    def _memory_store(key: Tuple[str, int, int], deck: LazyFlashcardDeck) -> None:
+        """Insert a deck into the in-memory LRU, evicting the oldest entry."""
+        cache = FlashcardLoader._memory_cache
+        cache[key] = deck
+        cache.move_to_end(key)
+        if len(cache) > FlashcardLoader._MEMORY_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _check_root(head: Union[str, bytes]) -> None:
+        """
+        Reject documents whose root cannot be an array or object.
+
+        One byte of lookahead spares the parser from scanning inputs that
+        could never validate; files that do start with '[' or '{' still go
+        through the real parser for full syntax checking.
+
+        Args:
+            head: The document, or any prefix containing its first token
+
+        Raises:
+            ValueError: If the first non-whitespace character rules the
+                document out
+        """
+        first = head.lstrip()[:1]
+        if first not in ("[", "{", b"[", b"{"):
+            raise ValueError("JSON root must be an array or object")
+
+    @staticmethod
+    def _parse_open_file(f: Any) -> Any:
+        """
+        Parse JSON from an open binary file.
+
+        With orjson on POSIX, the file is memory-mapped and parsed straight
+        from the mapping, avoiding the intermediate bytes copy that
+        f.read() makes (which doubles peak memory on large decks).
+
+        Args:
+            f: File object opened in binary mode
+
+        Returns:
+            Parsed JSON data
+
+        Raises:
+            ValueError: If the contents are not valid JSON
+        """
+        # Scan to the first non-whitespace byte, then rewind; a doomed
+        # root fails here without the parser touching the rest. Chunked
+        # so any amount of leading whitespace is skipped, not just the
+        # first buffer's worth.
+        first = b""
+        while True:
+            chunk = f.read(4096)
+            if not chunk:
+                break
+            stripped = chunk.lstrip()
+            if stripped:
+                first = stripped[:1]
+                break
+        FlashcardLoader._check_root(first)
+        f.seek(0)
+
+        if _HAS_ORJSON and os.name == "posix":
+            size = os.fstat(f.fileno()).st_size
+            if size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        return orjson.loads(view)
+                    finally:
+                        view.release()
+
+        raw = f.read()
+        if _HAS_ORJSON:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    @staticmethod
+    def _validate_and_parse(data: Any) -> LazyFlashcardDeck:
+        """
+        Validate JSON data and wrap it in a lazy flashcard deck.
 
         Supports three formats:
         1. Array format: [{"front": "...", "back": "..."}]
@@ -124,7 +557,7 @@ class FlashcardLoader:
             data: Parsed JSON data
 
         Returns:
-            List of Flashcard objects
+            LazyFlashcardDeck over the validated data
 
         Raises:
             ValueError: If data structure is invalid
@@ -151,28 +584,68 @@ class FlashcardLoader:
         if len(flashcards_data) == 0:
             raise ValueError("Flashcards list cannot be empty")
 
-        flashcards: List[Flashcard] = []
+        # Detect the key naming convention once, from the first item.
+        # Supports both "front"/"back" and "term"/"definition" keys.
+        first = flashcards_data[0]
+        if isinstance(first, dict) and "front" in first and "back" in first:
+            key_pair = ("front", "back")
+        else:
+            key_pair = ("term", "definition")
+        term_key, definition_key = key_pair
+
+        # Fast path: one all() sweep validates the common well-formed deck
+        # without per-item try/except or enumerate bookkeeping. Only when it
+        # fails do we rescan to produce an indexed diagnostic.
+        try:
+            valid = all(
+                isinstance(item[term_key], str)
+                and item[term_key]
+                and isinstance(item[definition_key], str)
+                and item[definition_key]
+                for item in flashcards_data
+            )
+        except (TypeError, KeyError):
+            valid = False
+
+        if not valid:
+            FlashcardLoader._raise_invalid_item(flashcards_data, term_key, definition_key)
+
+        return LazyFlashcardDeck(flashcards_data, key_pair)
+
+    @staticmethod
+    def _raise_invalid_item(
+        flashcards_data: List[Any], term_key: str, definition_key: str
+    ) -> None:
+        """
+        Rescan a deck that failed fast validation and raise with the index.
+
+        Args:
+            flashcards_data: The raw flashcard list
+            term_key: Detected key holding the term
+            definition_key: Detected key holding the definition
+
+        Raises:
+            ValueError: Always, describing the first invalid item
+        """
         for idx, item in enumerate(flashcards_data):
-            if not isinstance(item, dict):
+            try:
+                term = item[term_key]
+                definition = item[definition_key]
+            except TypeError:
                 raise ValueError(f"Flashcard at index {idx} must be an object")
-
-            # Support both "front"/"back" and "term"/"definition" keys
-            if "front" in item and "back" in item:
-                term = item["front"]
-                definition = item["back"]
-            elif "term" in item and "definition" in item:
-                term = item["term"]
-                definition = item["definition"]
-            else:
+            except KeyError:
                 raise ValueError(
                     f"Flashcard at index {idx} must have either "
                     "'front'/'back' or 'term'/'definition' keys"
                 )
-
-            try:
-                flashcard = Flashcard(term=term, definition=definition)
-                flashcards.append(flashcard)
-            except ValueError as e:
-                raise ValueError(f"Invalid flashcard at index {idx}: {e}")
-
-        return flashcards
+            if not term or not isinstance(term, str):
+                raise ValueError(
+                    f"Invalid flashcard at index {idx}: "
+                    "Flashcard term must be a non-empty string"
+                )
+            if not definition or not isinstance(definition, str):
+                raise ValueError(
+                    f"Invalid flashcard at index {idx}: "
+                    "Flashcard definition must be a non-empty string"
+                )
+        raise ValueError("Flashcard data failed validation")
@@ -1,19 +1,70 @@
 """Quiz engine for running flashcard quizzes."""
 
-from typing import List, Optional, Callable
-from .models import Flashcard, QuizResult, SessionStats
+import sys
+from functools import lru_cache
+from typing import List, Optional, Callable, Sequence
+from .models import Flashcard, QuizResult, SessionStats, normalize_answer
 from .strategies import QuizStrategy
+from .quiz_fast import check_batch
+
+# Strip punctuation that may appear inside acronyms (e.g. "U.S.", "TCP-IP")
+# in a single translate pass instead of chained str.replace calls.
+_ACRONYM_STRIP = str.maketrans("", "", ".-_")
+
+
+@lru_cache(maxsize=None)
+def _term_is_acronym(term: str) -> bool:
+    """
+    Determine if a term is likely an acronym or abbreviation.
+
+    Memoized per term: random/adaptive modes revisit cards, and the
+    classification of an immutable term never changes.
+
+    Args:
+        term: The term to check
+
+    Returns:
+        True if the term appears to be an acronym, False otherwise
+    """
+    cleaned = term.translate(_ACRONYM_STRIP)
+    return len(cleaned) >= 2 and cleaned.isupper() and cleaned.isalpha()
+
+
+@lru_cache(maxsize=256)
+def _format_feedback(is_correct: bool, user_answer: str, definition: str) -> str:
+    """
+    Build the feedback string for an answer.
+
+    Memoized: adaptive sessions resubmit the same wrong answers, and the
+    message depends only on these three immutable values.
+
+    Args:
+        is_correct: Whether the answer was correct
+        user_answer: The answer the user gave
+        definition: The card's correct definition
+
+    Returns:
+        Formatted feedback string
+    """
+    if is_correct:
+        return "✓ Correct!"
+    return (
+        f"✗ Incorrect.\n"
+        f"Your answer: {user_answer}\n"
+        f"Correct answer: {definition}"
+    )
 
 
 class QuizEngine:
     """Engine for running flashcard quizzes with different strategies."""
 
-    def __init__(self, flashcards: List[Flashcard], strategy: QuizStrategy) -> None:
+    def __init__(self, flashcards: Sequence[Flashcard], strategy: QuizStrategy) -> None:
         """
         Initialize the quiz engine.
 
         Args:
-            flashcards: List of flashcards to quiz
+            flashcards: Sequence of flashcards to quiz (a list or
+                a LazyFlashcardDeck from FlashcardLoader)
             strategy: Quiz strategy to use
 
         Raises:
@@ -62,12 +113,43 @@ class QuizEngine:
         Returns:
             True if correct, False otherwise
         """
-        # Case-insensitive comparison, strip whitespace
-        correct_answer = flashcard.definition.strip().lower()
-        user_answer_normalized = user_answer.strip().lower()
+        # Case-insensitive comparison, strip whitespace. The correct answer
+        # was normalized and interned once at load time; interning the
+        # user's side too lets == take CPython's pointer-identity fast path
+        # when the same answer recurs (adaptive mode re-asks cards). The
+        # length cap keeps arbitrary input out of the immortal intern table.
+        correct_answer = flashcard._norm_definition
+        user_answer_normalized = normalize_answer(user_answer)
+        if len(user_answer_normalized) < 128:
+            user_answer_normalized = sys.intern(user_answer_normalized)
 
         return correct_answer == user_answer_normalized
 
+    def check_answers_batch(self, user_answers: List[str]) -> List[bool]:
+        """
+        Check a full answer sheet against the deck in one pass.
+
+        Useful for auto-grading: answers are matched positionally against
+        the engine's flashcards. Uses the compiled batch checker when numba
+        is installed, otherwise a pure-Python comparison.
+
+        Args:
+            user_answers: One answer per flashcard, in deck order
+
+        Returns:
+            List of booleans, True where the answer is correct
+
+        Raises:
+            ValueError: If the number of answers doesn't match the deck size
+        """
+        if len(user_answers) != len(self.flashcards):
+            raise ValueError(
+                f"Expected {len(self.flashcards)} answers, got {len(user_answers)}"
+            )
+
+        normalized_definitions = [card._norm_definition for card in self.flashcards]
+        return check_batch(user_answers, normalized_definitions)
+
     def submit_answer(self, flashcard: Flashcard, user_answer: str) -> QuizResult:
         """
         Submit an answer and record the result.
@@ -100,14 +182,9 @@ class QuizEngine:
         Returns:
             Formatted feedback string
         """
-        if result.is_correct:
-            return "✓ Correct!"
-        else:
-            return (
-                f"✗ Incorrect.\n"
-                f"Your answer: {result.user_answer}\n"
-                f"Correct answer: {result.flashcard.definition}"
-            )
+        return _format_feedback(
+            result.is_correct, result.user_answer, result.flashcard.definition
+        )
 
     def get_stats(self) -> SessionStats:
         """
@@ -144,16 +221,16 @@ class InteractiveQuiz:
         """
         Determine if a term is likely an acronym or abbreviation.
 
+        Delegates to the memoized module-level classifier so repeated
+        presentations of the same card skip the string work.
+
         Args:
             term: The term to check
 
         Returns:
             True if the term appears to be an acronym, False otherwise
         """
-        # Remove common punctuation that might appear in acronyms
-        cleaned = term.replace(".", "").replace("-", "").replace("_", "")
-        # Consider it an acronym if it's all uppercase and has at least 2 characters
-        return len(cleaned) >= 2 and cleaned.isupper() and cleaned.isalpha()
+        return _term_is_acronym(term)
 
     def run(self) -> SessionStats:
         """
@@ -162,9 +239,10 @@ class InteractiveQuiz:
         Returns:
             Final session statistics
         """
-        self.output_fn("\n" + "=" * 50)
-        self.output_fn("Starting Quiz!")
-        self.output_fn("=" * 50 + "\n")
+        # One write for the whole banner; each output_fn call is a Python
+        # dispatch plus (in production) a write syscall.
+        sep = "=" * 50
+        self.output_fn(f"\n{sep}\nStarting Quiz!\n{sep}\n")
 
         question_num = 1
 
@@ -172,15 +250,26 @@ class InteractiveQuiz:
             try:
                 flashcard = self.engine.get_next_question()
 
-                self.output_fn(f"\nQuestion {question_num}:")
                 # Use appropriate question format based on whether term is an acronym
                 if self._is_acronym(flashcard.term):
-                    self.output_fn(f"What does '{flashcard.term}' stand for?")
+                    question = f"What does '{flashcard.term}' stand for?"
                 else:
-                    self.output_fn(f"What is '{flashcard.term}'?")
+                    question = f"What is '{flashcard.term}'?"
+
+                # Emit the question header and text as one write so each
+                # question costs exactly two output calls: this one before
+                # the prompt and the feedback after it. The input prompt in
+                # between is what stops the pair from collapsing to one.
+                self.output_fn(f"\nQuestion {question_num}:\n{question}")
 
                 user_answer = self.input_fn("Your answer: ")
 
+                # Input functions signal a user-requested exit by returning
+                # None (cheaper and cleaner than raising through the loop).
+                if user_answer is None:
+                    self.output_fn("\n\nQuiz interrupted by user.")
+                    break
+
                 result = self.engine.submit_answer(flashcard, user_answer)
                 feedback = self.engine.get_feedback(result)
 
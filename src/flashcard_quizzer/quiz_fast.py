@@ -0,0 +1,100 @@
+"""Optional accelerated batch answer checking.
+
+Interactive sessions check one answer at a time, where plain string
+comparison is plenty fast. Batch auto-grading (checking a whole answer
+sheet against a deck) benefits from a compiled path: when numba and
+numpy are installed, answers are compared as padded byte arrays inside
+an ``@njit``-compiled loop. Without them, a pure-Python fallback gives
+identical results.
+"""
+
+from typing import List, Sequence
+
+from .models import normalize_answer
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    _HAS_NUMPY = False
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = _HAS_NUMPY
+except ImportError:  # pragma: no cover - exercised when numba is absent
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)  # pragma: no cover - requires numba
+    def _compare_batch(user_bytes, user_lens, def_bytes, def_lens):
+        """Compare padded byte rows; returns a boolean array of matches."""
+        n = user_lens.shape[0]
+        out = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            if user_lens[i] != def_lens[i]:
+                out[i] = False
+                continue
+            match = True
+            for j in range(user_lens[i]):
+                if user_bytes[i, j] != def_bytes[i, j]:
+                    match = False
+                    break
+            out[i] = match
+        return out
+
+    def _encode_padded(texts: Sequence[str], width: int):
+        """Encode strings into a zero-padded 2D uint8 array plus lengths."""
+        encoded = [text.encode("utf-8") for text in texts]
+        arr = np.zeros((len(encoded), width), dtype=np.uint8)
+        lens = np.empty(len(encoded), dtype=np.int64)
+        for i, raw in enumerate(encoded):
+            arr[i, : len(raw)] = bytearray(raw)
+            lens[i] = len(raw)
+        return arr, lens
+
+
+def check_batch(
+    user_answers: Sequence[str], normalized_definitions: Sequence[str]
+) -> List[bool]:
+    """
+    Check a batch of user answers against pre-normalized definitions.
+
+    Args:
+        user_answers: Raw user answers, one per flashcard
+        normalized_definitions: Definitions already stripped and lowercased
+
+    Returns:
+        List of booleans, True where the answer matches
+
+    Raises:
+        ValueError: If the two sequences differ in length
+    """
+    if len(user_answers) != len(normalized_definitions):
+        raise ValueError("user_answers and definitions must have the same length")
+
+    normalized_answers = [normalize_answer(answer) for answer in user_answers]
+
+    if _HAS_NUMBA and normalized_answers:  # pragma: no cover - requires numba
+        width = max(
+            max(len(a.encode("utf-8")) for a in normalized_answers),
+            max(len(d.encode("utf-8")) for d in normalized_definitions),
+            1,
+        )
+        user_arr, user_lens = _encode_padded(normalized_answers, width)
+        def_arr, def_lens = _encode_padded(normalized_definitions, width)
+        return list(_compare_batch(user_arr, user_lens, def_arr, def_lens))
+
+    if _HAS_NUMPY and normalized_answers:  # pragma: no cover - requires numpy
+        # Elementwise unicode comparison runs as one C loop instead of a
+        # Python-level loop over the pairs.
+        matches = np.asarray(normalized_answers) == np.asarray(normalized_definitions)
+        return [bool(match) for match in matches]
+
+    return [
+        answer == definition
+        for answer, definition in zip(normalized_answers, normalized_definitions)
+    ]
@@ -1,171 +1,324 @@
 """Quiz mode strategies implementing the Strategy pattern."""
 
-from abc import ABC, abstractmethod
-from typing import List, Dict, Type
+from array import array
+from heapq import heappush, heappop
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Protocol, Type, Sequence
 import random
 from .models import Flashcard, QuizResult
 
 
-class QuizStrategy(ABC):
-    """Abstract base class for quiz mode strategies."""
+class QuizStrategy(Protocol):
+    """
+    Protocol for quiz mode strategies.
+
+    Structural typing only: concrete strategies satisfy it by signature
+    without inheriting, so instantiating them carries no ABC machinery.
+    """
 
-    @abstractmethod
     def get_next_flashcard(
-        self, flashcards: List[Flashcard], results: List[QuizResult]
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
     ) -> Flashcard:
         """
         Get the next flashcard to quiz.
 
         Args:
-            flashcards: List of all available flashcards
+            flashcards: Sequence of all available flashcards
             results: List of quiz results so far
 
         Returns:
             The next flashcard to present
         """
-        pass
+        ...
 
-    @abstractmethod
     def has_more_questions(
-        self, flashcards: List[Flashcard], results: List[QuizResult]
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
     ) -> bool:
         """
         Check if there are more questions to present.
 
         Args:
-            flashcards: List of all available flashcards
+            flashcards: Sequence of all available flashcards
             results: List of quiz results so far
 
         Returns:
             True if there are more questions, False otherwise
         """
-        pass
+        ...
 
 
-class SequentialStrategy(QuizStrategy):
+class SequentialStrategy:
     """Present flashcards in sequential order."""
 
+    __slots__ = ()
+
     def get_next_flashcard(
-        self, flashcards: List[Flashcard], results: List[QuizResult]
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
     ) -> Flashcard:
         """Get the next flashcard in sequential order."""
         index = len(results)
         return flashcards[index]
 
     def has_more_questions(
-        self, flashcards: List[Flashcard], results: List[QuizResult]
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
     ) -> bool:
         """Check if there are more flashcards in the sequence."""
         return len(results) < len(flashcards)
 
 
-class RandomStrategy(QuizStrategy):
+class RandomStrategy:
     """Present flashcards in random order without repetition."""
 
-    def __init__(self) -> None:
-        """Initialize the random strategy."""
-        self._shuffled_indices: List[int] = []
+    __slots__ = ("_rng", "_shuffled_indices", "_count", "_initialized")
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize the random strategy.
+
+        Args:
+            seed: Optional seed for reproducible shuffles. Each instance
+                owns its RNG, so concurrent sessions never contend on the
+                module-level generator's lock.
+        """
+        self._rng = random.Random(seed)
+        self._shuffled_indices: array = array("i")
+        self._count = 0
         self._initialized = False
 
-    def _initialize_shuffle(self, flashcards: List[Flashcard]) -> None:
+    def _initialize_shuffle(self, flashcards: Sequence[Flashcard]) -> None:
         """Initialize the shuffled indices if not already done."""
         if not self._initialized:
-            self._shuffled_indices = list(range(len(flashcards)))
-            random.shuffle(self._shuffled_indices)
+            # random.sample produces the permutation in a single
+            # Fisher-Yates pass; packing it into a C int array keeps the
+            # index buffer in one contiguous allocation.
+            count = len(flashcards)
+            self._shuffled_indices = array("i", self._rng.sample(range(count), count))
+            # The deck never changes mid-quiz; cache its size so the
+            # per-question bound check skips a len() call.
+            self._count = count
             self._initialized = True
+            # Specialize the instance: once the shuffle exists, later calls
+            # dispatch straight to the guard-free variants below.
+            self.__class__ = _InitializedRandomStrategy
+
+    def _next_flashcard(
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
+    ) -> Flashcard:
+        """Get the next flashcard in random order (shuffle already built)."""
+        index = self._shuffled_indices[len(results)]
+        return flashcards[index]
+
+    def _more_questions(
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
+    ) -> bool:
+        """Check if there are more flashcards to present."""
+        return len(results) < self._count
 
     def get_next_flashcard(
-        self, flashcards: List[Flashcard], results: List[QuizResult]
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
     ) -> Flashcard:
         """Get the next flashcard in random order."""
         self._initialize_shuffle(flashcards)
-        index = self._shuffled_indices[len(results)]
-        return flashcards[index]
+        return self._next_flashcard(flashcards, results)
 
     def has_more_questions(
-        self, flashcards: List[Flashcard], results: List[QuizResult]
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
     ) -> bool:
         """Check if there are more flashcards to present."""
         self._initialize_shuffle(flashcards)
-        return len(results) < len(flashcards)
+        return self._more_questions(flashcards, results)
+
+
+class _InitializedRandomStrategy(RandomStrategy):
+    """RandomStrategy after its one-time shuffle; skips the init guard."""
+
+    __slots__ = ()
 
+    get_next_flashcard = RandomStrategy._next_flashcard
+    has_more_questions = RandomStrategy._more_questions
 
-class AdaptiveStrategy(QuizStrategy):
+
+class AdaptiveStrategy:
     """
     Present flashcards adaptively, repeating incorrectly answered cards.
 
-    This strategy will continue until all flashcards have been answered correctly
-    at least once, prioritizing cards that were answered incorrectly.
+    Cards are scheduled through a priority heap of logical due times, in
+    the spirit of spaced-repetition (Leitner/SM-2) schedulers: a missed
+    card is re-queued a short interval ahead so other cards intervene
+    before it comes back. The strategy continues until every flashcard
+    has been answered correctly at least once.
     """
 
-    def __init__(self) -> None:
-        """Initialize the adaptive strategy."""
-        self._incorrect_terms: set[str] = set()
-        self._correct_terms: set[str] = set()
-        self._pending_cards: List[Flashcard] = []
+    __slots__ = (
+        "_rng",
+        "_correct",
+        "_index_by_id",
+        "_term_to_index",
+        "_order",
+        "_total",
+        "_heap",
+        "_version",
+        "_clock",
+        "_counter",
+        "_results_seen",
+        "_initialized",
+    )
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize the adaptive strategy.
+
+        Args:
+            seed: Optional seed for a reproducible presentation order.
+        """
+        self._rng = random.Random(seed)
+        self._correct: set[int] = set()
+        self._index_by_id: Dict[int, int] = {}
+        self._term_to_index: Dict[str, int] = {}
+        self._order: List[int] = []
+        self._total = 0
+        # Min-heap of (due, tiebreak, index, version); an entry is live
+        # only if its version matches _version[index] and the card has not
+        # been answered correctly. Rescheduling bumps the version instead
+        # of searching the heap, so stale entries are dropped lazily.
+        self._heap: List[tuple] = []
+        self._version: Dict[int, int] = {}
+        self._clock = 0
+        self._counter = 0
+        self._results_seen = 0
         self._initialized = False
 
-    def _initialize(self, flashcards: List[Flashcard]) -> None:
-        """Initialize the pending cards list."""
+    def _initialize(self, flashcards: Sequence[Flashcard]) -> None:
+        """Build the shuffled schedule and term-to-index map."""
         if not self._initialized:
-            self._pending_cards = flashcards.copy()
-            random.shuffle(self._pending_cards)
+            self._total = len(flashcards)
+            self._order = self._rng.sample(range(self._total), self._total)
+            # Due times 0..n-1 in shuffled order: the list is already
+            # heap-ordered, no heapify needed.
+            self._heap = [
+                (position, position, index, 0)
+                for position, index in enumerate(self._order)
+            ]
+            self._version = dict.fromkeys(self._order, 0)
+            self._counter = self._total
+            # id() keys make result lookups an integer hash instead of
+            # hashing the term string; the term map stays as a fallback for
+            # results built from equal-but-distinct Flashcard objects.
+            self._index_by_id = {
+                id(card): index for index, card in enumerate(flashcards)
+            }
+            self._term_to_index = {
+                card.term: index for index, card in enumerate(flashcards)
+            }
             self._initialized = True
+            # Specialize as above: subsequent calls skip this guard.
+            self.__class__ = _InitializedAdaptiveStrategy
 
-    def get_next_flashcard(
-        self, flashcards: List[Flashcard], results: List[QuizResult]
-    ) -> Flashcard:
-        """Get the next flashcard adaptively."""
-        self._initialize(flashcards)
+    def _consume_new_results(self, results: List[QuizResult]) -> None:
+        """
+        Fold results into the schedule incrementally.
 
-        # Update tracking based on previous result
-        if results:
-            last_result = results[-1]
-            if last_result.is_correct:
-                self._correct_terms.add(last_result.flashcard.term)
-                self._incorrect_terms.discard(last_result.flashcard.term)
+        Only results added since the last call are processed, so tracking
+        stays O(log N) per question instead of rescanning the full history
+        every time the engine polls the strategy. A correct answer retires
+        the card; an incorrect one reschedules it one tick ahead so at
+        least one other due card can intervene.
+        """
+        for result in results[self._results_seen :]:
+            index = self._index_by_id.get(id(result.flashcard))
+            if index is None:
+                index = self._term_to_index[result.flashcard.term]
+            if result.is_correct:
+                self._correct.add(index)
             else:
-                self._incorrect_terms.add(last_result.flashcard.term)
-
-        # Prioritize incorrect cards
-        if self._incorrect_terms:
-            # Find a flashcard from incorrect terms
-            for card in self._pending_cards:
-                if card.term in self._incorrect_terms:
-                    return card
+                self._version[index] += 1
+                heappush(
+                    self._heap,
+                    (self._clock + 1, self._counter, index, self._version[index]),
+                )
+                self._counter += 1
+            self._clock += 1
+        self._results_seen = len(results)
+
+    def _next_flashcard(
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
+    ) -> Flashcard:
+        """Get the next due flashcard (state already initialized)."""
+        self._consume_new_results(results)
+
+        # Serve the earliest-due live entry. The head is only popped once
+        # it goes stale (answered correctly or rescheduled), so a card
+        # served but never answered is not lost.
+        while self._heap:
+            due, tiebreak, index, version = self._heap[0]
+            if index in self._correct or version != self._version[index]:
+                heappop(self._heap)
+                continue
+            return flashcards[index]
+
+        # Fallback: everything answered correctly; return the first card
+        # in presentation order.
+        return flashcards[self._order[0]]
+
+    def _more_questions(
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
+    ) -> bool:
+        """Check if all flashcards have been answered correctly at least once."""
+        self._consume_new_results(results)
 
-        # Otherwise, find a card that hasn't been answered correctly yet
-        for card in self._pending_cards:
-            if card.term not in self._correct_terms:
-                return card
+        # Continue until all cards have been answered correctly
+        return len(self._correct) < self._total
 
-        # Fallback: return the first pending card
-        return self._pending_cards[0]
+    def get_next_flashcard(
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
+    ) -> Flashcard:
+        """Get the next flashcard adaptively, in O(log N) time."""
+        self._initialize(flashcards)
+        return self._next_flashcard(flashcards, results)
 
     def has_more_questions(
-        self, flashcards: List[Flashcard], results: List[QuizResult]
+        self, flashcards: Sequence[Flashcard], results: List[QuizResult]
     ) -> bool:
         """Check if all flashcards have been answered correctly at least once."""
         self._initialize(flashcards)
+        return self._more_questions(flashcards, results)
 
-        # Update tracking based on results
-        for result in results:
-            if result.is_correct:
-                self._correct_terms.add(result.flashcard.term)
-                self._incorrect_terms.discard(result.flashcard.term)
-            else:
-                self._incorrect_terms.add(result.flashcard.term)
 
-        # Continue until all cards have been answered correctly
-        return len(self._correct_terms) < len(flashcards)
+class _InitializedAdaptiveStrategy(AdaptiveStrategy):
+    """AdaptiveStrategy after its one-time setup; skips the init guard."""
+
+    __slots__ = ()
+
+    get_next_flashcard = AdaptiveStrategy._next_flashcard
+    has_more_questions = AdaptiveStrategy._more_questions
+
+
+# Mode registry, built once at import time. MappingProxyType keeps it
+# read-only so nothing can mutate the dispatch table at runtime.
+_STRATEGIES: Mapping[str, Type[QuizStrategy]] = MappingProxyType(
+    {
+        "sequential": SequentialStrategy,
+        "random": RandomStrategy,
+        "adaptive": AdaptiveStrategy,
+    }
+)
+_VALID_MODES = frozenset(_STRATEGIES)
+# The modes never change at runtime, so the error listing is joined once.
+_VALID_MODES_STR = ", ".join(_STRATEGIES)
 
+# SequentialStrategy holds no state, so one shared instance serves all
+# callers instead of allocating per call.
+_SEQUENTIAL_SINGLETON = SequentialStrategy()
 
-def get_strategy(mode: str) -> QuizStrategy:
+
+def get_strategy(mode: str, seed: Optional[int] = None) -> QuizStrategy:
     """
     Factory function to get the appropriate quiz strategy.
 
     Args:
         mode: The quiz mode ('sequential', 'random', or 'adaptive')
+        seed: Optional RNG seed for reproducible random/adaptive order;
+            ignored for the stateless sequential mode
 
     Returns:
         The appropriate QuizStrategy instance
@@ -173,15 +326,10 @@ def get_strategy(mode: str) -> QuizStrategy:
     Raises:
         ValueError: If mode is not recognized
     """
-    strategies: Dict[str, Type[QuizStrategy]] = {
-        "sequential": SequentialStrategy,
-        "random": RandomStrategy,
-        "adaptive": AdaptiveStrategy,
-    }
+    if mode not in _VALID_MODES:
+        raise ValueError(f"Invalid mode: {mode}. Must be one of: {_VALID_MODES_STR}")
 
-    if mode not in strategies:
-        raise ValueError(
-            f"Invalid mode: {mode}. Must be one of: {', '.join(strategies.keys())}"
-        )
+    if mode == "sequential":
+        return _SEQUENTIAL_SINGLETON
 
-    return strategies[mode]()
+    return _STRATEGIES[mode](seed)
@@ -0,0 +1,50 @@
+"""Shared pytest fixtures."""
+
+import json
+
+import pytest
+
+from flashcard_quizzer.models import Flashcard
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """
+    Point the per-user pickle cache at a per-test directory.
+
+    Without this, every test that loads a deck with caching enabled
+    would leave fcq_*.pkl files in the developer's real ~/.cache.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture(scope="session")
+def sample_flashcards():
+    """Fixture providing sample flashcards, built once per session.
+
+    Returns a tuple so the shared deck cannot be mutated between tests;
+    Flashcard itself is frozen.
+    """
+    return (
+        Flashcard(term="DNS", definition="Domain Name System"),
+        Flashcard(term="HTTP", definition="Hypertext Transfer Protocol"),
+        Flashcard(term="SSH", definition="Secure Shell"),
+    )
+
+
+@pytest.fixture
+def write_json(tmp_path):
+    """
+    Fixture factory that writes data as JSON under tmp_path.
+
+    Accepts a raw string to produce deliberately malformed files. pytest
+    removes tmp_path in bulk after the test, so callers skip the
+    NamedTemporaryFile/unlink boilerplate entirely.
+    """
+
+    def _write(data, name="cards.json"):
+        path = tmp_path / name
+        path.write_text(data if isinstance(data, str) else json.dumps(data))
+        return str(path)
+
+    return _write
@@ -1,13 +1,18 @@
 """Tests for CLI interface."""
 
 import pytest
-import json
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 from flashcard_quizzer.cli import parse_args, main
 
+# Deck shared by the TestMain cases; written per test via write_json.
+SAMPLE_DECK = {
+    "flashcards": [
+        {"term": "DNS", "definition": "Domain Name System"},
+        {"term": "HTTP", "definition": "Hypertext Transfer Protocol"},
+    ]
+}
+
 
 class TestParseArgs:
     """Tests for argument parsing."""
@@ -53,113 +58,76 @@ class TestParseArgs:
 class TestMain:
     """Tests for main CLI function."""
 
-    def create_temp_flashcard_file(self):
-        """Helper to create temporary flashcard file."""
-        data = {
-            "flashcards": [
-                {"term": "DNS", "definition": "Domain Name System"},
-                {"term": "HTTP", "definition": "Hypertext Transfer Protocol"},
-            ]
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            return f.name
-
     def test_main_file_not_found(self):
         """Test main with non-existent file."""
         exit_code = main(["nonexistent.json"])
         assert exit_code == 1
 
-    def test_main_invalid_json(self):
+    def test_main_invalid_json(self, write_json):
         """Test main with invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("{invalid json")
-            temp_path = f.name
+        temp_path = write_json("{invalid json")
 
-        try:
-            exit_code = main([temp_path])
-            assert exit_code == 1
-        finally:
-            Path(temp_path).unlink()
+        exit_code = main([temp_path])
+        assert exit_code == 1
 
-    def test_main_empty_flashcards(self):
+    def test_main_empty_flashcards(self, write_json):
         """Test main with empty flashcards list."""
-        data = {"flashcards": []}
+        temp_path = write_json({"flashcards": []})
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            exit_code = main([temp_path])
-            assert exit_code == 1
-        finally:
-            Path(temp_path).unlink()
+        exit_code = main([temp_path])
+        assert exit_code == 1
 
-    def test_main_invalid_mode(self):
+    def test_main_invalid_mode(self, write_json):
         """Test main with invalid quiz mode."""
-        temp_path = self.create_temp_flashcard_file()
+        temp_path = write_json(SAMPLE_DECK)
 
-        try:
-            # This will be caught at argument parsing level
-            with pytest.raises(SystemExit):
-                parse_args([temp_path, "--mode", "invalid"])
-        finally:
-            Path(temp_path).unlink()
+        # This will be caught at argument parsing level
+        with pytest.raises(SystemExit):
+            parse_args([temp_path, "--mode", "invalid"])
 
     @patch("flashcard_quizzer.cli.InteractiveQuiz")
-    def test_main_successful_run(self, mock_quiz_class):
+    def test_main_successful_run(self, mock_quiz_class, write_json):
         """Test successful main execution."""
-        temp_path = self.create_temp_flashcard_file()
+        temp_path = write_json(SAMPLE_DECK)
 
-        try:
-            # Mock the quiz run
-            mock_quiz_instance = mock_quiz_class.return_value
-            mock_quiz_instance.run.return_value = None
+        # Mock the quiz run
+        mock_quiz_instance = mock_quiz_class.return_value
+        mock_quiz_instance.run.return_value = None
 
-            exit_code = main([temp_path])
+        exit_code = main([temp_path])
 
-            assert exit_code == 0
-            assert mock_quiz_class.called
-        finally:
-            Path(temp_path).unlink()
+        assert exit_code == 0
+        assert mock_quiz_class.called
 
     @patch("flashcard_quizzer.cli.InteractiveQuiz")
-    def test_main_with_different_modes(self, mock_quiz_class):
+    def test_main_with_different_modes(self, mock_quiz_class, write_json):
         """Test main with different quiz modes."""
-        temp_path = self.create_temp_flashcard_file()
+        temp_path = write_json(SAMPLE_DECK)
 
-        try:
-            mock_quiz_instance = mock_quiz_class.return_value
-            mock_quiz_instance.run.return_value = None
+        mock_quiz_instance = mock_quiz_class.return_value
+        mock_quiz_instance.run.return_value = None
 
-            # Test sequential mode
-            exit_code = main([temp_path, "--mode", "sequential"])
-            assert exit_code == 0
+        # Test sequential mode
+        exit_code = main([temp_path, "--mode", "sequential"])
+        assert exit_code == 0
 
-            # Test random mode
-            exit_code = main([temp_path, "--mode", "random"])
-            assert exit_code == 0
+        # Test random mode
+        exit_code = main([temp_path, "--mode", "random"])
+        assert exit_code == 0
 
-            # Test adaptive mode
-            exit_code = main([temp_path, "--mode", "adaptive"])
-            assert exit_code == 0
-        finally:
-            Path(temp_path).unlink()
+        # Test adaptive mode
+        exit_code = main([temp_path, "--mode", "adaptive"])
+        assert exit_code == 0
 
     @patch("flashcard_quizzer.cli.InteractiveQuiz")
-    def test_main_keyboard_interrupt(self, mock_quiz_class):
+    def test_main_keyboard_interrupt(self, mock_quiz_class, write_json):
         """Test main handles keyboard interrupt."""
-        temp_path = self.create_temp_flashcard_file()
+        temp_path = write_json(SAMPLE_DECK)
 
-        try:
-            # Mock the quiz to raise KeyboardInterrupt
-            mock_quiz_instance = mock_quiz_class.return_value
-            mock_quiz_instance.run.side_effect = KeyboardInterrupt()
+        # Mock the quiz to raise KeyboardInterrupt
+        mock_quiz_instance = mock_quiz_class.return_value
+        mock_quiz_instance.run.side_effect = KeyboardInterrupt()
 
-            exit_code = main([temp_path])
+        exit_code = main([temp_path])
 
-            assert exit_code == 130
-        finally:
-            Path(temp_path).unlink()
+        assert exit_code == 130
@@ -0,0 +1,59 @@
+"""Tests for the file-handler utilities."""
+
+import pytest
+
+from utils.file_handler import FlashcardRecord, load_flashcards
+
+
+class TestLoadFlashcards:
+    """Tests for the specialized deck loader."""
+
+    def test_load_valid_deck(self, write_json):
+        """Test loading a well-formed deck file."""
+        path = write_json(
+            {
+                "flashcards": [
+                    {"term": "DNS", "definition": "Domain Name System"},
+                    {"term": "HTTP", "definition": "Hypertext Transfer Protocol"},
+                ]
+            }
+        )
+
+        records = load_flashcards(path)
+        assert records == [
+            FlashcardRecord("DNS", "Domain Name System"),
+            FlashcardRecord("HTTP", "Hypertext Transfer Protocol"),
+        ]
+
+    def test_missing_definition_raises_value_error(self, write_json):
+        """Test that an item without a definition raises ValueError."""
+        path = write_json({"flashcards": [{"term": "DNS"}]})
+
+        with pytest.raises(ValueError, match="Invalid flashcard data"):
+            load_flashcards(path)
+
+    def test_flashcards_not_list_raises_value_error(self, write_json):
+        """Test that a non-list flashcards value raises ValueError."""
+        path = write_json({"flashcards": "nope"})
+
+        with pytest.raises(ValueError, match="Invalid flashcard data"):
+            load_flashcards(path)
+
+    def test_missing_flashcards_key(self, write_json):
+        """Test that a deck without the flashcards key raises ValueError."""
+        path = write_json({"cards": []})
+
+        with pytest.raises(ValueError, match="Missing 'flashcards' key"):
+            load_flashcards(path)
+
+    def test_invalid_json(self, write_json):
+        """Test that malformed JSON raises ValueError."""
+        path = write_json("{invalid json")
+
+        with pytest.raises(ValueError, match="Invalid JSON format"):
+            load_flashcards(path)
+
+    def test_file_not_found(self):
+        """Test loading a non-existent deck file."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            load_flashcards("nonexistent.json")
@@ -1,9 +1,6 @@
 """Tests for flashcard loader - specifically for new format requirements."""
 
 import pytest
-import json
-import tempfile
-from pathlib import Path
 
 from flashcard_quizzer.models import FlashcardLoader
 
@@ -11,107 +8,88 @@ from flashcard_quizzer.models import FlashcardLoader
 class TestFlashcardLoaderNewFormats:
     """Tests for FlashcardLoader with new format requirements."""
 
-    def test_load_valid_flashcards_array(self):
+    def test_load_valid_flashcards_array(self, write_json):
         """Test loading array format: [{"front": "...", "back": "..."}]."""
-        data = [
-            {"front": "DNS", "back": "Domain Name System"},
-            {"front": "HTTP", "back": "Hypertext Transfer Protocol"},
-        ]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            cards = FlashcardLoader.load_from_json(temp_path)
-            assert len(cards) == 2
-            assert cards[0].term == "DNS"
-            assert cards[0].definition == "Domain Name System"
-            assert cards[1].term == "HTTP"
-            assert cards[1].definition == "Hypertext Transfer Protocol"
-        finally:
-            Path(temp_path).unlink()
-
-    def test_load_valid_flashcards_object_with_cards(self):
-        """Test loading object format: {"cards": [...]}."""
-        data = {
-            "cards": [
+        path = write_json(
+            [
                 {"front": "DNS", "back": "Domain Name System"},
                 {"front": "HTTP", "back": "Hypertext Transfer Protocol"},
             ]
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
+        )
 
-        try:
-            cards = FlashcardLoader.load_from_json(temp_path)
-            assert len(cards) == 2
-            assert cards[0].term == "DNS"
-            assert cards[0].definition == "Domain Name System"
-        finally:
-            Path(temp_path).unlink()
+        cards = FlashcardLoader.load_from_json(path)
+        assert len(cards) == 2
+        assert cards[0].term == "DNS"
+        assert cards[0].definition == "Domain Name System"
+        assert cards[1].term == "HTTP"
+        assert cards[1].definition == "Hypertext Transfer Protocol"
 
-    def test_load_invalid_json(self):
+    def test_load_valid_flashcards_object_with_cards(self, write_json):
+        """Test loading object format: {"cards": [...]}."""
+        path = write_json(
+            {
+                "cards": [
+                    {"front": "DNS", "back": "Domain Name System"},
+                    {"front": "HTTP", "back": "Hypertext Transfer Protocol"},
+                ]
+            }
+        )
+
+        cards = FlashcardLoader.load_from_json(path)
+        assert len(cards) == 2
+        assert cards[0].term == "DNS"
+        assert cards[0].definition == "Domain Name System"
+
+    def test_load_invalid_json(self, write_json):
         """Test that malformed JSON is handled gracefully."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("{invalid json syntax")
-            temp_path = f.name
+        path = write_json("{invalid json syntax")
 
-        try:
-            with pytest.raises(ValueError, match="Invalid JSON format"):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
+        with pytest.raises(ValueError, match="Invalid JSON format"):
+            FlashcardLoader.load_from_json(path)
 
-    def test_load_missing_required_field(self):
+    def test_load_missing_required_field(self, write_json):
         """Test that cards without required fields are rejected."""
         # Missing "back" field
-        data = [{"front": "DNS"}]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(
-                ValueError,
-                match="must have either 'front'/'back' or 'term'/'definition'",
-            ):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_load_mixed_format_front_back(self):
+        path = write_json([{"front": "DNS"}])
+
+        with pytest.raises(
+            ValueError,
+            match="must have either 'front'/'back' or 'term'/'definition'",
+        ):
+            FlashcardLoader.load_from_json(path)
+
+    def test_load_mixed_format_front_back(self, write_json):
         """Test loading with front/back format."""
-        data = [
-            {"front": "API", "back": "Application Programming Interface"},
-            {"front": "REST", "back": "Representational State Transfer"},
-        ]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            cards = FlashcardLoader.load_from_json(temp_path)
-            assert len(cards) == 2
-            assert cards[0].term == "API"
-            assert cards[0].definition == "Application Programming Interface"
-        finally:
-            Path(temp_path).unlink()
-
-    def test_empty_back_field_rejected(self):
-        """Test that empty back field is rejected."""
-        data = [{"front": "DNS", "back": ""}]
+        path = write_json(
+            [
+                {"front": "API", "back": "Application Programming Interface"},
+                {"front": "REST", "back": "Representational State Transfer"},
+            ]
+        )
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
+        cards = FlashcardLoader.load_from_json(path)
+        assert len(cards) == 2
+        assert cards[0].term == "API"
+        assert cards[0].definition == "Application Programming Interface"
 
-        try:
-            with pytest.raises(ValueError, match="Invalid flashcard"):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
+    def test_empty_back_field_rejected(self, write_json):
+        """Test that empty back field is rejected."""
+        path = write_json([{"front": "DNS", "back": ""}])
+
+        with pytest.raises(ValueError, match="Invalid flashcard"):
+            FlashcardLoader.load_from_json(path)
+
+    def test_stream_matches_eager_load(self, write_json):
+        """Test that the streaming loader yields the same cards as load_from_json."""
+        path = write_json(
+            {
+                "flashcards": [
+                    {"term": "DNS", "definition": "Domain Name System"},
+                    {"term": "HTTP", "definition": "Hypertext Transfer Protocol"},
+                ]
+            }
+        )
+
+        streamed = list(FlashcardLoader.load_from_json_stream(path))
+        eager = list(FlashcardLoader.load_from_json(path))
+        assert streamed == eager
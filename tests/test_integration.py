@@ -1,21 +1,10 @@
 """Integration tests for full quiz sessions."""
 
 import pytest
-from flashcard_quizzer.models import Flashcard
 from flashcard_quizzer.strategies import SequentialStrategy
 from flashcard_quizzer.quiz import QuizEngine
 
 
-@pytest.fixture
-def sample_flashcards():
-    """Fixture providing sample flashcards for integration tests."""
-    return [
-        Flashcard(term="DNS", definition="Domain Name System"),
-        Flashcard(term="HTTP", definition="Hypertext Transfer Protocol"),
-        Flashcard(term="SSH", definition="Secure Shell"),
-    ]
-
-
 class TestIntegration:
     """Integration tests for complete quiz sessions."""
 
@@ -67,7 +56,7 @@ class TestIntegration:
         engine = QuizEngine(sample_flashcards, strategy)
 
         # Answer all questions correctly
-        for card in sample_flashcards:
+        for _ in range(len(sample_flashcards)):
             question = engine.get_next_question()
             engine.submit_answer(question, question.definition)
 
@@ -85,7 +74,7 @@ class TestIntegration:
         engine = QuizEngine(sample_flashcards, strategy)
 
         # Answer all questions incorrectly
-        for card in sample_flashcards:
+        for _ in range(len(sample_flashcards)):
             question = engine.get_next_question()
             engine.submit_answer(question, "Wrong Answer")
 
@@ -1,15 +1,29 @@
 """Tests for data models."""
 
 import pytest
+import io
 import json
-import tempfile
-from pathlib import Path
 
 from flashcard_quizzer.models import (
     Flashcard,
     QuizResult,
     SessionStats,
     FlashcardLoader,
+    LazyFlashcardDeck,
+)
+
+# Deck payloads serialized once at import; tests reuse the strings
+# instead of re-running json.dumps on the same literals per test.
+_VALID_DECK_JSON = json.dumps(
+    {
+        "flashcards": [
+            {"term": "DNS", "definition": "Domain Name System"},
+            {"term": "HTTP", "definition": "Hypertext Transfer Protocol"},
+        ]
+    }
+)
+_SINGLE_CARD_JSON = json.dumps(
+    {"flashcards": [{"term": "DNS", "definition": "Domain Name System"}]}
 )
 
 
@@ -160,142 +174,86 @@ class TestSessionStats:
 class TestFlashcardLoader:
     """Tests for FlashcardLoader class."""
 
-    def test_load_valid_json(self):
+    def test_load_valid_json(self, write_json):
         """Test loading valid JSON file."""
-        data = {
-            "flashcards": [
-                {"term": "DNS", "definition": "Domain Name System"},
-                {"term": "HTTP", "definition": "Hypertext Transfer Protocol"},
-            ]
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            cards = FlashcardLoader.load_from_json(temp_path)
-            assert len(cards) == 2
-            assert cards[0].term == "DNS"
-            assert cards[0].definition == "Domain Name System"
-            assert cards[1].term == "HTTP"
-        finally:
-            Path(temp_path).unlink()
+        temp_path = write_json(_VALID_DECK_JSON)
+
+        cards = FlashcardLoader.load_from_json(temp_path)
+        assert len(cards) == 2
+        assert cards[0].term == "DNS"
+        assert cards[0].definition == "Domain Name System"
+        assert cards[1].term == "HTTP"
+
+    def test_load_returns_lazy_deck(self, write_json):
+        """Test that loading returns a lazy deck that materializes on access."""
+        temp_path = write_json(_VALID_DECK_JSON)
+
+        deck = FlashcardLoader.load_from_json(temp_path)
+        assert isinstance(deck, LazyFlashcardDeck)
+        # Repeated access returns the same cached Flashcard instance
+        assert deck[0] is deck[0]
+        # Iteration yields all cards in order
+        assert [card.term for card in deck] == ["DNS", "HTTP"]
+
+    def test_cache_round_trip(self, write_json):
+        """Test that a cached reload returns the same cards."""
+        # The autouse isolated_cache_dir fixture keeps the cache files
+        # private to the test and cleaned up with its tmp_path.
+        temp_path = write_json(_SINGLE_CARD_JSON)
+
+        first = FlashcardLoader.load_from_json(temp_path)
+        # Drop the in-process LRU so the second load has to come back
+        # through the on-disk pickle cache rather than memory.
+        FlashcardLoader._memory_cache.clear()
+        second = FlashcardLoader.load_from_json(temp_path)
+        assert len(second) == len(first)
+        assert second[0] == first[0]
+        # Bypassing the cache still works
+        uncached = FlashcardLoader.load_from_json(temp_path, use_cache=False)
+        assert uncached[0] == first[0]
+
+    def test_load_from_file_object(self):
+        """Test loading from an in-memory file-like object."""
+        cards = FlashcardLoader.load_from_json(io.StringIO(_SINGLE_CARD_JSON))
+
+        assert len(cards) == 1
+        assert cards[0].term == "DNS"
 
     def test_file_not_found(self):
         """Test loading non-existent file."""
         with pytest.raises(FileNotFoundError, match="Flashcard file not found"):
             FlashcardLoader.load_from_json("nonexistent.json")
 
-    def test_invalid_json_format(self):
-        """Test loading file with invalid JSON."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("{invalid json")
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="Invalid JSON format"):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_json_not_object(self):
-        """Test JSON that is not an object (but supports arrays now)."""
-        # Array format is now valid, so test with invalid item in array
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(["string instead of object"], f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="must be an object"):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_missing_flashcards_key(self):
-        """Test JSON missing 'flashcards' or 'cards' key."""
-        data = {"other_key": []}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(
-                ValueError, match="must contain 'cards' or 'flashcards'"
-            ):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_flashcards_not_list(self):
-        """Test 'flashcards' value is not a list."""
-        data = {"flashcards": "not a list"}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="data must be a list"):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_empty_flashcards_list(self):
-        """Test empty flashcards list."""
-        data = {"flashcards": []}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="Flashcards list cannot be empty"):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_flashcard_not_object(self):
-        """Test flashcard item that is not an object."""
-        data = {"flashcards": ["string instead of object"]}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(
-                ValueError, match="Flashcard at index 0 must be an object"
-            ):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_missing_term_or_definition(self):
-        """Test flashcard missing term or definition."""
-        data = {"flashcards": [{"term": "DNS"}]}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="must have either"):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_invalid_flashcard_data(self):
-        """Test flashcard with invalid data."""
-        data = {"flashcards": [{"term": "", "definition": "Definition"}]}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(ValueError, match="Invalid flashcard at index 0"):
-                FlashcardLoader.load_from_json(temp_path)
-        finally:
-            Path(temp_path).unlink()
+    @pytest.mark.parametrize(
+        "payload,message",
+        [
+            ("{invalid json", "Invalid JSON format"),
+            (json.dumps(["string instead of object"]), "must be an object"),
+            (json.dumps({"other_key": []}), "must contain 'cards' or 'flashcards'"),
+            (json.dumps({"flashcards": "not a list"}), "data must be a list"),
+            (json.dumps({"flashcards": []}), "Flashcards list cannot be empty"),
+            (
+                json.dumps({"flashcards": ["string instead of object"]}),
+                "Flashcard at index 0 must be an object",
+            ),
+            (json.dumps({"flashcards": [{"term": "DNS"}]}), "must have either"),
+            (
+                json.dumps({"flashcards": [{"term": "", "definition": "Definition"}]}),
+                "Invalid flashcard at index 0",
+            ),
+        ],
+        ids=[
+            "invalid-json",
+            "item-not-object",
+            "missing-deck-key",
+            "deck-not-list",
+            "empty-deck",
+            "flashcard-not-object",
+            "missing-term-or-definition",
+            "empty-term",
+        ],
+    )
+    def test_rejects_malformed_deck(self, payload, message):
+        """Test that malformed deck payloads raise the expected ValueError."""
+        with pytest.raises(ValueError, match=message):
+            FlashcardLoader.load_from_json(io.StringIO(payload))
@@ -6,16 +6,6 @@ from flashcard_quizzer.strategies import SequentialStrategy, RandomStrategy
 from flashcard_quizzer.quiz import QuizEngine, InteractiveQuiz
 
 
-@pytest.fixture
-def sample_flashcards():
-    """Fixture providing sample flashcards."""
-    return [
-        Flashcard(term="DNS", definition="Domain Name System"),
-        Flashcard(term="HTTP", definition="Hypertext Transfer Protocol"),
-        Flashcard(term="SSH", definition="Secure Shell"),
-    ]
-
-
 class TestQuizEngine:
     """Tests for QuizEngine class."""
 
@@ -131,6 +121,24 @@ class TestQuizEngine:
         assert engine.stats.incorrect_answers == 1
         assert engine.stats.total_questions == 1
 
+    def test_check_answers_batch(self, sample_flashcards):
+        """Test batch-checking a full answer sheet."""
+        strategy = SequentialStrategy()
+        engine = QuizEngine(sample_flashcards, strategy)
+
+        answers = ["domain name system", "Wrong Answer", "  Secure Shell  "]
+        results = engine.check_answers_batch(answers)
+
+        assert results == [True, False, True]
+
+    def test_check_answers_batch_length_mismatch(self, sample_flashcards):
+        """Test that a wrong-sized answer sheet raises an error."""
+        strategy = SequentialStrategy()
+        engine = QuizEngine(sample_flashcards, strategy)
+
+        with pytest.raises(ValueError, match="Expected 3 answers"):
+            engine.check_answers_batch(["only one"])
+
     def test_get_feedback_correct(self, sample_flashcards):
         """Test feedback for correct answer."""
         strategy = SequentialStrategy()
@@ -185,10 +193,10 @@ class TestInteractiveQuiz:
 
         # Create mock functions
         inputs = ["Domain Name System", "HTTP Protocol", "SSH"]
+        input_iter = iter(inputs)
         outputs = []
 
-        def mock_input(prompt):
-            return inputs.pop(0)
+        mock_input = lambda prompt: next(input_iter)
 
         def mock_output(text):
             outputs.append(text)
@@ -234,10 +242,10 @@ class TestInteractiveQuiz:
         engine = QuizEngine(sample_flashcards, strategy)
 
         inputs = [card.definition for card in sample_flashcards]
+        input_iter = iter(inputs)
         outputs = []
 
-        def mock_input(prompt):
-            return inputs.pop(0)
+        mock_input = lambda prompt: next(input_iter)
 
         def mock_output(text):
             outputs.append(text)
@@ -263,10 +271,10 @@ class TestInteractiveQuiz:
         engine = QuizEngine(regular_flashcards, strategy)
 
         inputs = ["A step-by-step procedure", "A named storage location"]
+        input_iter = iter(inputs)
         outputs = []
 
-        def mock_input(prompt):
-            return inputs.pop(0)
+        mock_input = lambda prompt: next(input_iter)
 
         def mock_output(text):
             outputs.append(text)
@@ -288,10 +296,10 @@ class TestInteractiveQuiz:
 
         # Prepare correct answers
         inputs = [card.definition for card in sample_flashcards]
+        input_iter = iter(inputs)
         outputs = []
 
-        def mock_input(prompt):
-            return inputs.pop(0)
+        mock_input = lambda prompt: next(input_iter)
 
         def mock_output(text):
             outputs.append(text)
@@ -311,10 +319,10 @@ class TestInteractiveQuiz:
 
         # Prepare mixed answers
         inputs = ["Domain Name System", "Wrong Answer", "Secure Shell"]
+        input_iter = iter(inputs)
         outputs = []
 
-        def mock_input(prompt):
-            return inputs.pop(0)
+        mock_input = lambda prompt: next(input_iter)
 
         def mock_output(text):
             outputs.append(text)
@@ -332,10 +340,10 @@ class TestInteractiveQuiz:
         engine = QuizEngine(sample_flashcards, strategy)
 
         inputs = [card.definition for card in sample_flashcards]
+        input_iter = iter(inputs)
         outputs = []
 
-        def mock_input(prompt):
-            return inputs.pop(0)
+        mock_input = lambda prompt: next(input_iter)
 
         def mock_output(text):
             outputs.append(text)
@@ -355,10 +363,10 @@ class TestInteractiveQuiz:
         engine = QuizEngine(sample_flashcards, strategy)
 
         inputs = ["Domain Name System", "Wrong", "Secure Shell"]
+        input_iter = iter(inputs)
         outputs = []
 
-        def mock_input(prompt):
-            return inputs.pop(0)
+        mock_input = lambda prompt: next(input_iter)
 
         def mock_output(text):
             outputs.append(text)
@@ -376,10 +384,10 @@ class TestInteractiveQuiz:
         engine = QuizEngine(sample_flashcards, strategy)
 
         inputs = [card.definition for card in sample_flashcards]
+        input_iter = iter(inputs)
         outputs = []
 
-        def mock_input(prompt):
-            return inputs.pop(0)
+        mock_input = lambda prompt: next(input_iter)
 
         def mock_output(text):
             outputs.append(text)
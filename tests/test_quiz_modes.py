@@ -1,7 +1,7 @@
 """Tests for quiz mode factory and adaptive behavior."""
 
 import pytest
-from flashcard_quizzer.models import Flashcard, QuizResult
+from flashcard_quizzer.models import QuizResult
 from flashcard_quizzer.strategies import (
     get_strategy,
     SequentialStrategy,
@@ -10,16 +10,6 @@ from flashcard_quizzer.strategies import (
 )
 
 
-@pytest.fixture
-def sample_flashcards():
-    """Fixture providing sample flashcards."""
-    return [
-        Flashcard(term="DNS", definition="Domain Name System"),
-        Flashcard(term="HTTP", definition="Hypertext Transfer Protocol"),
-        Flashcard(term="SSH", definition="Secure Shell"),
-    ]
-
-
 class TestQuizModeFactory:
     """Tests for quiz mode factory pattern."""
 
@@ -1,19 +1,61 @@
 """File handling utilities for flashcard quizzer."""
 
 import json
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple
 from pathlib import Path
 
+try:
+    import orjson
 
-def load_json_file(filepath: str) -> Any:
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _HAS_ORJSON = False
+
+try:
+    import msgspec
+
+    _HAS_MSGSPEC = True
+except ImportError:  # pragma: no cover - exercised when msgspec is absent
+    _HAS_MSGSPEC = False
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(abs_path: str, mtime_ns: int, size: int, schema: Any = None) -> Any:
+    """
+    Read and parse a file, memoized on its identity and stat signature.
+
+    The mtime_ns/size arguments only serve as cache-key components: an
+    edited file gets a new signature and misses the cache. Failed parses
+    are not cached, so a fixed file re-parses cleanly.
+    """
+    raw = Path(abs_path).read_bytes()
+    if schema is not None and _HAS_MSGSPEC:
+        return msgspec.json.decode(raw, type=schema)
+    return orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+
+
+def load_json_file(filepath: str, schema: Any = None) -> Any:
     """
     Load and parse a JSON file.
 
+    The file is read in binary mode and handed to the parser as one
+    buffer: orjson decodes UTF-8 in C when installed, and stdlib
+    json.loads accepts bytes directly, so neither path pays for an
+    intermediate decoded str. Repeated loads of an unchanged file are
+    served from an in-process LRU keyed by (path, mtime, size); callers
+    share the parsed structure and must not mutate it. Use
+    load_json_file.cache_clear() to drop the cache.
+
     Args:
         filepath: Path to the JSON file
+        schema: Optional type to decode into directly (e.g. a typed
+            record list) when msgspec is installed; parse, validation and
+            construction then happen in one C pass. Without msgspec the
+            plain parsed data is returned and the caller converts it.
 
     Returns:
-        Parsed JSON data
+        Parsed JSON data, or schema instances when requested and available
 
     Raises:
         FileNotFoundError: If the file doesn't exist
@@ -21,13 +63,105 @@ def load_json_file(filepath: str) -> Any:
     """
     file_path = Path(filepath)
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
-
+    # EAFP: the stat both reports a missing file and supplies the cache
+    # key, so no extra syscall precedes the read.
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        st = file_path.stat()
+        return _parse_cached(
+            str(file_path.resolve()), st.st_mtime_ns, st.st_size, schema
+        )
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {filepath}") from e
+    except ValueError as e:
+        # json.JSONDecodeError and orjson.JSONDecodeError both subclass
+        # ValueError, so one handler covers either parser.
         raise ValueError(f"Invalid JSON format in {filepath}: {e}")
-    except Exception as e:
+    except OSError as e:
+        # Narrow rebox for I/O failures (permissions, directories); other
+        # exceptions such as MemoryError propagate untouched.
         raise ValueError(f"Error reading file {filepath}: {e}")
+
+
+load_json_file.cache_clear = _parse_cached.cache_clear
+
+
+class FlashcardRecord(NamedTuple):
+    """One term/definition pair as stored in a deck file."""
+
+    term: str
+    definition: str
+
+
+if _HAS_MSGSPEC:
+
+    class _FlashcardItem(msgspec.Struct):
+        """Typed mirror of one deck item for the specialized decoder."""
+
+        term: str
+        definition: str
+
+    # Decoders specialized once at import. The document decoder keeps the
+    # flashcards value as raw bytes so JSON syntax errors and malformed
+    # items surface as distinct errors, matching the generic path; the
+    # item decoder then validates keys and types in one C pass.
+    _DOCUMENT_DECODER = msgspec.json.Decoder(Dict[str, msgspec.Raw])
+    _FLASHCARD_DECODER = msgspec.json.Decoder(List[_FlashcardItem])
+
+
+def load_flashcards(filepath: str) -> List[FlashcardRecord]:
+    """
+    Load the flashcard list from a {"flashcards": [...]} deck file.
+
+    With msgspec installed, the import-time specialized decoder parses
+    and validates the items in one C pass and the records are built from
+    the typed structs; otherwise the file is parsed generically and the
+    records are built from plain dicts. Both paths return the same
+    record type and raise the same errors for the same inputs.
+
+    Args:
+        filepath: Path to the deck JSON file
+
+    Returns:
+        List of FlashcardRecord entries in file order
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If JSON is invalid or the 'flashcards' key is missing
+    """
+    file_path = Path(filepath)
+
+    try:
+        raw = file_path.read_bytes()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {filepath}") from e
+
+    # msgspec.DecodeError subclasses ValueError, as do both stdlib and
+    # orjson JSONDecodeErrors, so one handler covers every backend.
+    try:
+        if _HAS_MSGSPEC:
+            document = _DOCUMENT_DECODER.decode(raw)
+        else:
+            document = orjson.loads(raw) if _HAS_ORJSON else json.loads(raw)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON format in {filepath}: {e}")
+
+    try:
+        flashcards = document["flashcards"]
+    except (KeyError, TypeError):
+        raise ValueError(f"Missing 'flashcards' key in {filepath}")
+
+    if _HAS_MSGSPEC:
+        try:
+            items = _FLASHCARD_DECODER.decode(flashcards)
+        except ValueError as e:
+            raise ValueError(f"Invalid flashcard data in {filepath}: {e}")
+        return [FlashcardRecord(item.term, item.definition) for item in items]
+
+    # The generic parse enforces no shape, so translate malformed items
+    # into the same ValueError the specialized decoder raises.
+    try:
+        return [
+            FlashcardRecord(item["term"], item["definition"]) for item in flashcards
+        ]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid flashcard data in {filepath}: {e}")